@@ -1,7 +1,6 @@
 import json
 import logging
 import os
-import traceback
 import uuid
 from datetime import datetime
 from typing import Type
@@ -51,6 +50,7 @@ class BaseAgent(AgentRegistryMixin):
 
         self._context = AgentContext()
         self.conversation = []
+        self._system_prompt_cache: tuple[tuple[Type[BaseTool], ...], str] | None = None
 
         self.streaming_generator = OpenAIStreamingGenerator(model=self.id)
         self.logger = logging.getLogger(f"sgr_agent_core.agents.{self.id}")
@@ -139,6 +139,14 @@ class BaseAgent(AgentRegistryMixin):
 
         json.dump(agent_log, open(filepath, "w", encoding="utf-8"), indent=2, ensure_ascii=False)
 
+    def _get_system_prompt(self) -> str:
+        """Render the system prompt once per toolkit instead of on every
+        context preparation."""
+        toolkit = tuple(self.toolkit)
+        if self._system_prompt_cache is None or self._system_prompt_cache[0] != toolkit:
+            self._system_prompt_cache = (toolkit, PromptLoader.get_system_prompt(self.toolkit, self.config.prompts))
+        return self._system_prompt_cache[1]
+
     async def _prepare_context(self) -> list[dict]:
         """Prepare a conversation context with system prompt, task data and any
         other context.
@@ -150,7 +158,7 @@ class BaseAgent(AgentRegistryMixin):
         """
 
         return [
-            {"role": "system", "content": PromptLoader.get_system_prompt(self.toolkit, self.config.prompts)},
+            {"role": "system", "content": self._get_system_prompt()},
             *self.task_messages,
             {"role": "user", "content": PromptLoader.get_initial_user_request(self.task_messages, self.config.prompts)},
             *self.conversation,
@@ -211,16 +219,15 @@ class BaseAgent(AgentRegistryMixin):
     ):
         self.logger.info(f"🚀 User provided {len(self.task_messages)} messages.")
         try:
-            while self._context.state not in AgentStatesEnum.FINISH_STATES.value:
+            while self._context.state not in AgentStatesEnum.FINISH_STATES:
                 self._context.iteration += 1
                 self.logger.info(f"Step {self._context.iteration} started")
                 await self._execution_step()
             return self._context.execution_result
 
         except Exception as e:
-            self.logger.error(f"❌ Agent execution error: {str(e)}")
+            self.logger.exception(f"❌ Agent execution error: {str(e)}")
             self._context.state = AgentStatesEnum.FAILED
-            traceback.print_exc()
         finally:
             if self.streaming_generator is not None:
                 self.streaming_generator.finish(self._context.execution_result)
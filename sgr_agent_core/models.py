@@ -1,6 +1,6 @@
 import asyncio
 from datetime import datetime
-from enum import Enum
+from enum import Enum, nonmember
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -40,7 +40,7 @@ class AgentStatesEnum(str, Enum):
     ERROR = "error"
     FAILED = "failed"
 
-    FINISH_STATES = {COMPLETED, FAILED, ERROR}
+    FINISH_STATES = nonmember(frozenset({COMPLETED, FAILED, ERROR}))
 
 
 class AgentContext(BaseModel):
@@ -18,6 +18,9 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Upper bound for coalescing already queued SSE events into one response chunk
+STREAM_CHUNK_SIZE = 16 * 1024
+
 # ToDo: better to move to a separate service
 agents_storage: dict[str, BaseAgent] = {}
 
@@ -38,7 +41,7 @@ async def get_agent_state(agent_id: str):
         agent_id=agent.id,
         task_messages=agent.task_messages,
         sources_count=len(agent._context.sources),
-        **agent._context.model_dump(),
+        **agent._context.agent_state(),
     )
 
 
@@ -84,7 +87,7 @@ async def provide_clarification(agent_id: str, request: ClarificationRequest):
 
         await agent.provide_clarification(request.messages)
         return StreamingResponse(
-            agent.streaming_generator.stream(),
+            agent.streaming_generator.stream(max_chunk_size=STREAM_CHUNK_SIZE),
             media_type="text/event-stream",
             headers={
                 "Cache-Control": "no-cache",
@@ -98,12 +101,6 @@ async def provide_clarification(agent_id: str, request: ClarificationRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-def _is_agent_id(model_str: str) -> bool:
-    """Check if the model string is an agent ID (contains underscore and UUID-
-    like format)."""
-    return "_" in model_str and len(model_str) > 20
-
-
 @router.post("/v1/chat/completions")
 async def create_chat_completion(request: ChatCompletionRequest):
     if not request.stream:
@@ -111,9 +108,7 @@ async def create_chat_completion(request: ChatCompletionRequest):
 
     # Check if this is a clarification request for an existing agent
     if (
-        request.model
-        and isinstance(request.model, str)
-        and _is_agent_id(request.model)
+        isinstance(request.model, str)
         and request.model in agents_storage
         and agents_storage[request.model]._context.state == AgentStatesEnum.WAITING_FOR_CLARIFICATION
     ):
@@ -136,7 +131,7 @@ async def create_chat_completion(request: ChatCompletionRequest):
         agents_storage[agent.id] = agent
         _ = asyncio.create_task(agent.execute())
         return StreamingResponse(
-            agent.streaming_generator.stream(),
+            agent.streaming_generator.stream(max_chunk_size=STREAM_CHUNK_SIZE),
             media_type="text/event-stream",
             headers={
                 "Cache-Control": "no-cache",
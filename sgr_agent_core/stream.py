@@ -15,11 +15,28 @@ class StreamingGenerator:
     def finish(self):
         self.queue.put_nowait(None)  # Termination signal
 
-    async def stream(self):
-        while True:
+    async def stream(self, max_chunk_size: int | None = None):
+        """Yields queued data until the termination signal.
+
+        With max_chunk_size set, data already waiting in the queue is joined
+        into chunks of about that size; it never waits to fill a chunk.
+        """
+        finished = False
+        while not finished:
             data = await self.queue.get()
             if data is None:  # Termination signal
                 break
+            if max_chunk_size:
+                parts = [data]
+                size = len(data)
+                while size < max_chunk_size and not self.queue.empty():
+                    data = self.queue.get_nowait()
+                    if data is None:  # Termination signal
+                        finished = True
+                        break
+                    parts.append(data)
+                    size += len(data)
+                data = "".join(parts)
             yield data
 
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import os
@@ -39,10 +40,15 @@ class CreateReportTool(BaseTool):
     )
     confidence: Literal["high", "medium", "low"] = Field(description="Confidence in findings")
 
+    @staticmethod
+    def _save_report(reports_dir: str, filepath: str, content: str) -> None:
+        os.makedirs(reports_dir, exist_ok=True)
+        with open(filepath, "w", encoding="utf-8") as f:
+            f.write(content)
+
     async def __call__(self, context: AgentContext, config: AgentConfig, **_) -> str:
         # Save report
         reports_dir = config.execution.reports_dir
-        os.makedirs(reports_dir, exist_ok=True)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         safe_title = "".join(c for c in self.title if c.isalnum() or c in (" ", "-", "_"))[:50]
         filename = f"{timestamp}_{safe_title}.md"
@@ -59,8 +65,8 @@ class CreateReportTool(BaseTool):
             full_content += "## Sources\n\n"
             full_content += "\n".join([str(source) for source in context.sources.values()])
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(full_content)
+        # Blocking file I/O runs in a worker thread to keep the event loop streaming
+        await asyncio.to_thread(self._save_report, reports_dir, filepath, full_content)
 
         report = {
             "title": self.title,
@@ -13,7 +13,6 @@ from fastapi import HTTPException
 from sgr_agent_core.agents import SGRAgent
 from sgr_agent_core.models import AgentStatesEnum
 from sgr_agent_core.server.endpoints import (
-    _is_agent_id,
     agents_storage,
     create_chat_completion,
     get_agent_state,
@@ -24,50 +23,6 @@ from sgr_agent_core.server.models import ChatCompletionRequest, ClarificationReq
 from tests.conftest import create_test_agent
 
 
-class TestIsAgentId:
-    """Tests for _is_agent_id utility function."""
-
-    def test_valid_agent_id_format(self):
-        """Test that valid agent ID format is recognized."""
-        valid_ids = [
-            "sgr_agent_12345678-1234-1234-1234-123456789012",
-            "tool_calling_agent_abcdef01-2345-6789-abcd-ef0123456789",
-            "custom_agent_aaaaaaaa-bbbb-cccc-dddd-eeeeeeeeeeee",
-        ]
-
-        for agent_id in valid_ids:
-            assert _is_agent_id(agent_id) is True
-
-    def test_invalid_agent_id_format(self):
-        """Test that invalid agent ID format is rejected."""
-        invalid_ids = [
-            "sgr_agent",  # No UUID
-            "short_id",  # Too short
-            "",  # Empty string
-            "model_name",  # Regular model name
-        ]
-
-        for invalid_id in invalid_ids:
-            assert _is_agent_id(invalid_id) is False
-
-    def test_edge_case_lengths(self):
-        """Test edge cases around minimum length requirement."""
-        # Exactly 20 characters with underscore - should be invalid (need >20)
-        exactly_20 = "a_bcdefghijklmnopqr"
-        assert len(exactly_20) == 19
-        assert _is_agent_id(exactly_20) is False
-
-        # 21 characters with underscore - should be valid
-        exactly_21 = "a_bcdefghijklmnopqrs"
-        assert len(exactly_21) == 20
-        assert _is_agent_id(exactly_21) is False
-
-        # 22 characters with underscore - should be valid
-        exactly_22 = "a_bcdefghijklmnopqrst"
-        assert len(exactly_22) == 21
-        assert _is_agent_id(exactly_22) is True
-
-
 class TestChatCompletionEndpoint:
     """Tests for create_chat_completion endpoint."""
 
@@ -245,6 +200,22 @@ class TestChatCompletionEndpoint:
         assert exc_info.value.status_code == 400
         assert "Invalid model" in str(exc_info.value.detail)
 
+    @pytest.mark.asyncio
+    async def test_unknown_agent_id_treated_as_model_name(self):
+        """Test that an agent ID missing from storage is validated as a model
+        name."""
+        request = ChatCompletionRequest(
+            model="sgr_agent_12345678-1234-1234-1234-123456789012",
+            messages=[{"role": "user", "content": "Test task"}],
+            stream=True,
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            await create_chat_completion(request)
+
+        assert exc_info.value.status_code == 400
+        assert "Invalid model" in str(exc_info.value.detail)
+
     @pytest.mark.asyncio
     async def test_clarification_request_for_existing_agent(self):
         """Test providing clarification to existing agent."""
@@ -318,6 +289,35 @@ class TestAgentStateEndpoint:
         assert response.task_messages[0]["role"] == "system"
         assert response.task_messages[1]["role"] == "user"
 
+    @pytest.mark.asyncio
+    async def test_get_agent_state_does_not_dump_context(self):
+        """Test agent state is built from the context without dumping
+        searches and sources."""
+        from sgr_agent_core.models import AgentContext
+        from sgr_agent_core.tools import ReasoningTool
+
+        agent = create_test_agent(SGRAgent, task_messages=[{"role": "user", "content": "Test task"}])
+        agent._context.iteration = 3
+        agent._context.searches_used = 2
+        agent._context.current_step_reasoning = ReasoningTool(
+            reasoning_steps=["Step 1", "Step 2"],
+            current_situation="Searching",
+            plan_status="On track",
+            remaining_steps=["Search more"],
+            task_completed=False,
+        )
+        agents_storage[agent.id] = agent
+
+        with patch.object(AgentContext, "model_dump", autospec=True, side_effect=AgentContext.model_dump) as mock_dump:
+            response = await get_agent_state(agent.id)
+
+        mock_dump.assert_called_once()
+        assert {"searches", "sources"} <= mock_dump.call_args.kwargs["exclude"]
+        assert response.state == AgentStatesEnum.INITED
+        assert response.iteration == 3
+        assert response.searches_used == 2
+        assert response.current_step_reasoning["current_situation"] == "Searching"
+
     @pytest.mark.asyncio
     async def test_get_agent_state_not_found(self):
         """Test agent state retrieval for non-existent agent."""
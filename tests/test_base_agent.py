@@ -403,6 +403,27 @@ class TestBaseAgentPrepareContext:
 
         assert len(context) == 6  # system + task_messages + initial_user_request + 3 conversation messages
 
+    @pytest.mark.asyncio
+    async def test_prepare_context_renders_system_prompt_once_per_toolkit(self):
+        """Test that the system prompt is rendered once and re-rendered only
+        when the toolkit changes."""
+        from unittest.mock import patch
+
+        from sgr_agent_core.services.prompt_loader import PromptLoader
+
+        agent = create_test_agent(BaseAgent, task_messages=[{"role": "user", "content": "Test"}])
+
+        with patch.object(PromptLoader, "get_system_prompt", return_value="system") as mock_get_system_prompt:
+            await agent._prepare_context()
+            await agent._prepare_context()
+            assert mock_get_system_prompt.call_count == 1
+
+            agent.toolkit = [ReasoningTool]
+            context = await agent._prepare_context()
+            assert mock_get_system_prompt.call_count == 2
+
+        assert context[0]["content"] == "system"
+
 
 class TestBaseAgentSaveLog:
     """Tests for agent log saving functionality."""
@@ -146,19 +146,24 @@ class TestAgentStatesEnum:
 
     def test_agent_states_finish_states(self):
         """Test that FINISH_STATES contains terminal states."""
-        # FINISH_STATES is a set stored as an Enum member value
-        finish_states = AgentStatesEnum.FINISH_STATES.value
+        finish_states = AgentStatesEnum.FINISH_STATES
         assert AgentStatesEnum.COMPLETED in finish_states
         assert AgentStatesEnum.FAILED in finish_states
         assert AgentStatesEnum.ERROR in finish_states
 
     def test_agent_states_non_finish_states(self):
         """Test that non-terminal states are not in FINISH_STATES."""
-        finish_states = AgentStatesEnum.FINISH_STATES.value
+        finish_states = AgentStatesEnum.FINISH_STATES
         assert AgentStatesEnum.INITED not in finish_states
         assert AgentStatesEnum.RESEARCHING not in finish_states
         assert AgentStatesEnum.WAITING_FOR_CLARIFICATION not in finish_states
 
+    def test_agent_states_finish_states_is_not_member(self):
+        """Test that FINISH_STATES is a frozenset and not an enum member."""
+        assert isinstance(AgentStatesEnum.FINISH_STATES, frozenset)
+        assert "FINISH_STATES" not in AgentStatesEnum.__members__
+        assert len(list(AgentStatesEnum)) == 6
+
     def test_agent_states_is_enum(self):
         """Test that AgentStatesEnum is a proper Enum."""
         from enum import Enum
@@ -84,6 +84,34 @@ class TestStreamingGenerator:
 
         assert items == test_items
 
+    @pytest.mark.asyncio
+    async def test_stream_coalesces_queued_items(self):
+        """Test that queued items are joined into chunks up to
+        max_chunk_size."""
+        generator = StreamingGenerator()
+        for item in ["aaaa", "bbbb", "cccc", "dddd", "ee"]:
+            generator.add(item)
+        generator.finish()
+
+        items = []
+        async for item in generator.stream(max_chunk_size=8):
+            items.append(item)
+
+        assert items == ["aaaabbbb", "ccccdddd", "ee"]
+
+    @pytest.mark.asyncio
+    async def test_stream_coalescing_does_not_wait_for_more_data(self):
+        """Test that a partial chunk is yielded without waiting to fill it."""
+        generator = StreamingGenerator()
+        generator.add("data")
+        stream = generator.stream(max_chunk_size=1024)
+
+        assert await stream.__anext__() == "data"
+
+        generator.add("more")
+        generator.finish()
+        assert [item async for item in stream] == ["more"]
+
     @pytest.mark.asyncio
     async def test_stream_order_preserved(self):
         """Test that streaming preserves item order."""
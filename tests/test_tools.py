@@ -5,7 +5,9 @@ This module contains simple tests for all tools:
 - Config reading (if needed)
 """
 
-from unittest.mock import patch
+from unittest.mock import Mock, patch
+
+import pytest
 
 from sgr_agent_core.tools import (
     AdaptPlanTool,
@@ -148,3 +150,25 @@ class TestToolsConfigReading:
         )
         # Tool should be initialized without errors
         assert tool.title == "Test Report"
+
+    @pytest.mark.asyncio
+    async def test_create_report_tool_saves_report(self, tmp_path):
+        """Test CreateReportTool writes the report into configured reports_dir."""
+        from sgr_agent_core.models import AgentContext
+
+        tool = CreateReportTool(
+            reasoning="Test",
+            title="Test Report",
+            user_request_language_reference="Test",
+            content="Test content",
+            confidence="high",
+        )
+        config = Mock()
+        config.execution.reports_dir = str(tmp_path / "reports")
+
+        result = await tool(AgentContext(), config)
+
+        saved_files = list((tmp_path / "reports").iterdir())
+        assert len(saved_files) == 1
+        assert "Test content" in saved_files[0].read_text(encoding="utf-8")
+        assert str(saved_files[0]) in result